@@ -1,30 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import os
-import random
 import time
 
 from functional_tests.conftest import IAMBIC_TEST_DETAILS
 from iambic.core.iambic_enum import IambicManaged
 from iambic.core.parser import load_templates
+from iambic.core.utils import yaml
 from iambic.main import run_apply
+from iambic.plugins.v0_1_0.okta.user.utils import get_user
+
+
+def wait_for_okta_user_attr(
+    okta_organization,
+    username: str,
+    attr_path: str,
+    expected_value,
+    timeout: float = 30,
+    interval: float = 0.5,
+):
+    """Poll Okta until the user attribute matches expected_value.
+
+    Replaces a fixed propagation sleep; returns as soon as Okta reflects the
+    expected value instead of always waiting out the worst case.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        user = asyncio.run(get_user(username, None, okta_organization))
+        value = user
+        for attr in attr_path.split("."):
+            if value is None:
+                break
+            value = value.get(attr) if isinstance(value, dict) else getattr(value, attr)
+        if value == expected_value:
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Okta user {username} did not reach {attr_path}={expected_value} within {timeout}s"
+            )
+        time.sleep(interval)
+        # exponential backoff to avoid hammering the Okta API
+        interval = min(interval * 2, 5)
 
 
 def test_okta_user():
     temp_templates_directory = IAMBIC_TEST_DETAILS.template_dir_path
-    username = f"iambic_functional_test_user_{random.randint(0, 1000000)}"
-    iambic_functional_test_user_yaml = f"""template_type: NOQ::Okta::User
-idp_name: development
-properties:
-  username: {username}
-  profile:
-    firstName: iambic
-    lastName: {username}
-    email: {username}@example.com
-    login: {username}@example.com
-  status: active
-"""
+    # Deterministic per xdist worker so reruns reuse (and clean up) the same
+    # Okta user instead of leaking a randomly named one per run.
+    username = f"iambic_functional_test_user_{os.getenv('PYTEST_XDIST_WORKER', '0')}"
+    iambic_functional_test_user = {
+        "template_type": "NOQ::Okta::User",
+        "idp_name": "development",
+        "properties": {
+            "username": username,
+            "profile": {
+                "firstName": "iambic",
+                "lastName": username,
+                "email": f"{username}@example.com",
+                "login": f"{username}@example.com",
+            },
+            "status": "active",
+        },
+    }
     test_user_fp = os.path.join(
         temp_templates_directory,
         f"resources/okta/user/development/{username}.yaml",
@@ -37,7 +76,7 @@ properties:
         exist_ok=True,
     )
     with open(test_user_fp, "w") as temp_file:
-        temp_file.write(iambic_functional_test_user_yaml)
+        yaml.dump(iambic_functional_test_user, temp_file)
 
     # Create user
     run_apply(IAMBIC_TEST_DETAILS.config, [test_user_fp])
@@ -51,8 +90,14 @@ properties:
     # Test Updating Template
     user_template.properties.profile["firstName"] = "TestNameChange"
     user_template.write()
-    # Sleep to give profile time to propagate
-    time.sleep(30)
+    # Give the created profile time to propagate before applying the update
+    wait_for_okta_user_attr(
+        IAMBIC_TEST_DETAILS.config.okta.get_organization("development"),
+        username,
+        "profile.firstName",
+        "iambic",
+        timeout=30,
+    )
     run_apply(IAMBIC_TEST_DETAILS.config, [test_user_fp])
     user_template = load_templates(
         [test_user_fp], IAMBIC_TEST_DETAILS.config.okta.template_map
@@ -61,9 +106,10 @@ properties:
 
     # set the template to import_only
     proposed_changes_path = "{0}/proposed_changes.json".format(os.getcwd())
-    if os.path.isfile(proposed_changes_path):
+    # remove stats the file itself, so no separate isfile check is needed
+    try:
         os.remove(proposed_changes_path)
-    else:
+    except FileNotFoundError:
         assert (
             False  # Previous changes are not being written out to proposed_changes.yaml
         )
@@ -72,9 +118,10 @@ properties:
     user_template.properties.profile["firstName"] = "shouldNotWork"
     user_template.write()
     run_apply(IAMBIC_TEST_DETAILS.config, [test_user_fp])
-    if os.path.isfile(proposed_changes_path):
-        assert os.path.getsize(proposed_changes_path) == 2  # {} is 2 bytes
-    else:
+    # One stat covers both the existence and the size check
+    try:
+        assert os.stat(proposed_changes_path).st_size == 2  # {} is 2 bytes
+    except FileNotFoundError:
         # this is acceptable as well because there are no changes to be made.
         pass
     user_template.iambic_managed = IambicManaged.UNDEFINED
@@ -6,6 +6,24 @@ from typing import Any, Awaitable, TypeVar
 T = TypeVar("T")
 
 
+async def gather_structured(*args: Awaitable[T]) -> list[Any]:
+    """
+    Like asyncio.gather but with structured concurrency semantics.
+
+    On Python 3.11+ this runs the awaitables in an asyncio.TaskGroup, so a
+    failure deterministically cancels the remaining siblings (no orphaned
+    in-flight requests) and failures surface as an ExceptionGroup. Older
+    interpreters fall back to plain asyncio.gather.
+
+    Results are returned in input order.
+    """
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(arg) for arg in args]
+        return [task.result() for task in tasks]
+    return await asyncio.gather(*args)
+
+
 async def gather_limit(
     *args: Awaitable[T],
     return_exceptions: bool = False,
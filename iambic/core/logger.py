@@ -70,3 +70,15 @@ def configure_logger(logger_name, log_level):
 
 
 log = configure_logger("iambic", os.getenv("LOG_LEVEL", "INFO"))
+
+
+def is_debug_enabled() -> bool:
+    """Return True when DEBUG records pass the configured log level.
+
+    structlog's filtering bound logger drops excluded records cheaply, but the
+    caller still pays to build the kwargs for the call; hot paths can use this
+    to skip that work entirely. The filtering wrapper class doesn't expose
+    isEnabledFor, so derive the answer from the same env var used to
+    configure it.
+    """
+    return logging.getLevelName(os.getenv("LOG_LEVEL", "INFO")) <= logging.DEBUG
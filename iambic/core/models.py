@@ -638,6 +638,11 @@ class BaseTemplate(
         with open(self.file_path, "w") as f:
             f.write(as_yaml)
 
+        # import here to avoid a circular import at module load time
+        from iambic.core.parser import invalidate_cached_template
+
+        invalidate_cached_template(str(self.file_path))
+
     def delete(self):
         log.info("Deleting template file", file_path=self.file_path)
         if self.is_memory_only:
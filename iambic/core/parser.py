@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import sys
 import time
 import traceback
 from functools import partial
-from typing import Type, Union
+from typing import Optional, Type, Union
 
 from pydantic import ValidationError
 from ruamel.yaml.scanner import ScannerError
@@ -24,6 +25,53 @@ else:
     from multiprocessing import Pool, cpu_count
 
 
+# Parsed template dicts keyed by absolute path. Each entry stores the file's
+# (st_mtime_ns, st_size) fingerprint at parse time so repeated loads of an
+# unchanged file skip the YAML parse and comment transformation entirely.
+_template_dict_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# Template classes whose forward refs have already been rebound. Resolving
+# forward refs walks every field annotation, so only pay for it once per class.
+_forward_refs_resolved: set[Type[BaseTemplate]] = set()
+
+
+def _template_fingerprint(template_path: str) -> Union[None, tuple[int, int]]:
+    try:
+        file_stat = os.stat(template_path)
+    except OSError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _get_cached_template_dict(template_path: str) -> Optional[dict]:
+    abs_path = os.path.abspath(template_path)
+    cached = _template_dict_cache.get(abs_path)
+    if not cached:
+        return None
+    fingerprint, template_dict = cached
+    if fingerprint != _template_fingerprint(abs_path):
+        del _template_dict_cache[abs_path]
+        return None
+    # Deep copy so callers can mutate the returned dict without poisoning the cache
+    return copy.deepcopy(template_dict)
+
+
+def _cache_template_dict(template_path: str, template_dict: dict) -> None:
+    abs_path = os.path.abspath(template_path)
+    fingerprint = _template_fingerprint(abs_path)
+    if fingerprint:
+        _template_dict_cache[abs_path] = (fingerprint, copy.deepcopy(template_dict))
+
+
+def invalidate_cached_template(template_path: str) -> None:
+    """Drop the cached parse result for template_path, if any.
+
+    Called whenever a template file is written so stale parse results
+    can never outlive the file contents they were derived from.
+    """
+    _template_dict_cache.pop(os.path.abspath(template_path), None)
+
+
 # line number is zero-th based
 def resolve_location(loc_list: list[str], ruamel_dict) -> Union[None, int]:
     local_loc_list = loc_list
@@ -77,11 +125,16 @@ def format_validation_error(err, ruamel_dict):
 
 
 def load_template(template_path: str, raise_validation_err: bool = True) -> dict:
+    cached_template_dict = _get_cached_template_dict(template_path)
+    if cached_template_dict is not None:
+        return cached_template_dict
+
     try:
         template_dict = transform_comments(yaml.load(open(template_path)))
         template_type = template_dict.get("template_type")
         if template_type and template_type not in ["NOQ::Core::Config"]:
             template_dict["file_path"] = template_path
+            _cache_template_dict(template_path, template_dict)
             return template_dict
     except ScannerError as err:
         log.critical(
@@ -98,23 +151,40 @@ def load_templates(
     use_multiprocessing=True,
 ) -> list[BaseTemplate]:
     templates = []
-    template_dicts = None
+    template_dicts = [None] * len(template_paths)
+
+    # Resolve cache hits up front. The cache must be consulted (and populated)
+    # in this process because the worker pool's caches die with the workers.
+    uncached_indices = []
+    for idx, template_path in enumerate(template_paths):
+        cached_template_dict = _get_cached_template_dict(template_path)
+        if cached_template_dict is not None:
+            template_dicts[idx] = cached_template_dict
+        else:
+            uncached_indices.append(idx)
 
-    if use_multiprocessing:
+    if uncached_indices and use_multiprocessing:
         load_template_fn = partial(
             load_template, raise_validation_err=raise_validation_err
         )
         with Pool(max(1, cpu_count() // 2)) as p:
-            template_dicts = p.map(load_template_fn, template_paths)
+            loaded_dicts = p.map(
+                load_template_fn, [template_paths[idx] for idx in uncached_indices]
+            )
             if getattr(sys, "gettrace", None):
                 # When in debug mode, subprocesses can exit
                 # before debugger can attach
                 # https://github.com/microsoft/debugpy/issues/712
                 time.sleep(0.5)
-    else:
-        template_dicts = [
-            load_template(path, raise_validation_err) for path in template_paths
-        ]
+        for idx, template_dict in zip(uncached_indices, loaded_dicts):
+            template_dicts[idx] = template_dict
+            if template_dict:
+                _cache_template_dict(template_paths[idx], template_dict)
+    elif uncached_indices:
+        for idx in uncached_indices:
+            template_dicts[idx] = load_template(
+                template_paths[idx], raise_validation_err
+            )
 
     for template_dict in template_dicts:
         if not template_dict:
@@ -122,7 +192,9 @@ def load_templates(
 
         try:
             template_cls = template_map[template_dict["template_type"]]
-            template_cls.update_forward_refs()
+            if template_cls not in _forward_refs_resolved:
+                template_cls.update_forward_refs()
+                _forward_refs_resolved.add(template_cls)
             templates.append(template_cls(**template_dict))
         except KeyError:
             log.critical(
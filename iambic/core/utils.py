@@ -451,6 +451,12 @@ yaml.indent(mapping=2, sequence=4, offset=2)
 yaml.representer.ignore_aliases = lambda *data: True
 yaml.width = 4096
 
+# C-accelerated (libyaml) safe loader for data-only documents. Templates must
+# keep using the round-trip instance above because transform_comments depends
+# on the comment metadata only the pure python "rt" loader produces.
+yaml_safe = NoqYaml(typ="safe", pure=False)
+yaml_safe.default_flow_style = False
+
 
 def evaluate_on_provider(
     resource,
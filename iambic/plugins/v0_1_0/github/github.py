@@ -31,7 +31,7 @@ from iambic.core.git import clone_git_repo, get_remote_default_branch
 from iambic.core.iambic_enum import Command
 from iambic.core.logger import log
 from iambic.core.models import ExecutionMessage, TemplateChangeDetails
-from iambic.core.utils import decode_with_reference_time, yaml
+from iambic.core.utils import decode_with_reference_time, yaml_safe
 from iambic.main import run_apply, run_detect, run_expire, run_git_apply, run_git_plan
 from iambic.plugins.v0_1_0.github.iambic_plugin import GithubConfig
 from iambic.plugins.v0_1_0.github.utils import IAMBIC_APPLY_ERROR_METADATA
@@ -191,7 +191,9 @@ def load_proposed_changes(filepath: str) -> dict:
     if not os.path.exists(filepath):
         return {}
     with open(filepath, "r") as f:
-        return yaml.load(f)
+        # proposed_changes.yaml is machine-generated output; the C-accelerated
+        # safe loader is much faster and no comments need preserving.
+        return yaml_safe.load(f)
 
 
 # TODO do more formatting to emphasize resources deletion
@@ -307,13 +309,15 @@ def handle_issue_comment(
     comment_body = context["event"]["comment"]["body"]
     comment_user_login = context["event"]["comment"]["user"]["login"]
 
-    command_lookup = comment_body.split("\n")[0]
+    comment_match = _COMMENT_COMMAND_RE.match(comment_body)
 
-    if command_lookup not in COMMENT_DISPATCH_MAP:
+    if not comment_match:
         log_params = {"comment_body": comment_body}
         log.error("handle_issue_comment: no op", **log_params)
         return HandleIssueCommentReturnCode.NO_MATCHING_BODY
 
+    command_lookup = comment_match.group(0)
+
     github_token = context["token"]
     # repo_name is already in the format {repo_owner}/{repo_short_name}
     repo_name = context["repository"]
@@ -1101,6 +1105,14 @@ COMMENT_DISPATCH_MAP: dict[str, Callable] = {
     "iambic approve": handle_iambic_approve,
 }
 
+# Compiled once at import; matches a dispatchable command as the entire first
+# line of a comment body without splitting the whole body on every webhook.
+_COMMENT_COMMAND_RE = re.compile(
+    "^(?:"
+    + "|".join(re.escape(command) for command in COMMENT_DISPATCH_MAP)
+    + r")(?=\n|$)"
+)
+
 if __name__ == "__main__":
     github_context_json_str = os.environ.get("GITHUB_CONTEXT")
     github_override_token = os.environ.get("GH_OVERRIDE_TOKEN")
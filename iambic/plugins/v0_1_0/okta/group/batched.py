@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from iambic.plugins.v0_1_0.okta.group.utils import (
+    get_group,
+    list_group_users,
+    list_groups_without_members,
+)
+from iambic.plugins.v0_1_0.okta.models import Group
+
+if TYPE_CHECKING:
+    from iambic.plugins.v0_1_0.okta.iambic_plugin import OktaOrganization
+
+# How long a drain waits for additional operations to pile up before issuing
+# the shared Okta call. Kept short so single lookups see negligible latency.
+BATCH_INTERVAL_SECONDS = 0.01
+
+
+class GetGroup:
+    """A pending group read, resolved by the fetcher's drain loop."""
+
+    def __init__(self, group_id: str, group_name: str):
+        self.group_id = group_id
+        self.group_name = group_name
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class BatchedGroupFetcher:
+    """Coalesces concurrent group reads against one Okta organization.
+
+    Each caller suspends on a future; after a short drain window all pending
+    reads share a single group-listing scan, and membership is hydrated only
+    for the groups actually requested — never for every group in the
+    organization. A lone read falls through to the targeted get_group lookup,
+    so nothing changes for the sequential case.
+    """
+
+    def __init__(
+        self,
+        okta_organization: OktaOrganization,
+        batch_interval: float = BATCH_INTERVAL_SECONDS,
+    ):
+        self.okta_organization = okta_organization
+        self.batch_interval = batch_interval
+        self.pending: list[GetGroup] = []
+        self.drain_task: Optional[asyncio.Task] = None
+        # The loop this fetcher's futures and drain tasks belong to. A fetcher
+        # must not outlive its loop (see get_group_batched).
+        self.loop = asyncio.get_running_loop()
+
+    async def apply(self, op: GetGroup) -> Optional[Group]:
+        self.pending.append(op)
+        if self.drain_task is None or self.drain_task.done():
+            self.drain_task = asyncio.create_task(self._drain())
+        return await op.future
+
+    async def _drain(self):
+        await asyncio.sleep(self.batch_interval)
+        ops, self.pending = self.pending, []
+        # Re-arm before awaiting Okta: an op arriving while the call below is
+        # in flight missed this batch, so the next apply must start a fresh
+        # drain for it rather than seeing this still-running task and waiting
+        # on a drain that has already taken its snapshot.
+        self.drain_task = None
+        if not ops:
+            return
+
+        if len(ops) == 1:
+            # No coalescing opportunity; use the targeted lookup
+            op = ops[0]
+            try:
+                result = await get_group(
+                    op.group_id, op.group_name, self.okta_organization
+                )
+            except Exception as err:
+                if not op.future.done():
+                    op.future.set_exception(err)
+                return
+            if not op.future.done():
+                op.future.set_result(result)
+            return
+
+        try:
+            groups = await list_groups_without_members(self.okta_organization)
+            groups_by_id = {group.group_id: group for group in groups}
+            groups_by_name = {group.name: group for group in groups}
+            # Hydrate membership only for the groups this batch asked about;
+            # orgs can hold thousands of groups and listing every group's
+            # members would dwarf the targeted lookups being coalesced. The
+            # fan-out is at most one call per op, and ops are bounded by the
+            # config semaphore their callers hold.
+            requested_groups = {
+                id(group): group
+                for op in ops
+                if (
+                    group := groups_by_id.get(op.group_id)
+                    or groups_by_name.get(op.group_name)
+                )
+            }
+            await asyncio.gather(
+                *[
+                    list_group_users(group, self.okta_organization)
+                    for group in requested_groups.values()
+                ]
+            )
+        except Exception as err:
+            for op in ops:
+                # A future is already done if its awaiter was cancelled;
+                # resolving it again would raise InvalidStateError and strand
+                # the rest of the batch.
+                if not op.future.done():
+                    op.future.set_exception(err)
+            return
+
+        for op in ops:
+            if not op.future.done():
+                op.future.set_result(
+                    groups_by_id.get(op.group_id) or groups_by_name.get(op.group_name)
+                )
+
+
+_fetchers: dict[str, BatchedGroupFetcher] = {}
+
+
+async def get_group_batched(
+    group_id: str, group_name: str, okta_organization: OktaOrganization
+) -> Optional[Group]:
+    """Drop-in replacement for get_group that batches concurrent reads.
+
+    Reads issued while other group templates are being applied to the same
+    organization share one group-listing scan plus one membership lookup per
+    requested group, instead of a listing scan per template.
+    """
+    fetcher = _fetchers.get(okta_organization.idp_name)
+    if (
+        fetcher is None
+        or fetcher.okta_organization is not okta_organization
+        or fetcher.loop is not asyncio.get_running_loop()
+    ):
+        # A fetcher from a previous asyncio.run carries futures and possibly a
+        # stranded drain task bound to a dead loop; reusing it would block
+        # every later read on this org forever.
+        fetcher = _fetchers[okta_organization.idp_name] = BatchedGroupFetcher(
+            okta_organization
+        )
+    return await fetcher.apply(GetGroup(group_id, group_name))
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import os
-from itertools import chain
 from typing import TYPE_CHECKING, Any, List, Optional
 
 from pydantic import Field, validator
 
+from iambic.core.aio_utils import gather_structured
 from iambic.core.context import ctx
 from iambic.core.iambic_enum import Command, IambicManaged
-from iambic.core.logger import log
+from iambic.core.logger import is_debug_enabled, log
 from iambic.core.models import (
     AccountChangeDetails,
     BaseModel,
@@ -19,9 +19,9 @@ from iambic.core.models import (
     ProposedChangeType,
     TemplateChangeDetails,
 )
+from iambic.plugins.v0_1_0.okta.group.batched import get_group_batched
 from iambic.plugins.v0_1_0.okta.group.utils import (
     create_group,
-    get_group,
     maybe_delete_group,
     update_group_description,
     update_group_members,
@@ -34,6 +34,10 @@ if TYPE_CHECKING:
 
 OKTA_GROUP_TEMPLATE_TYPE = "NOQ::Okta::Group"
 
+# Sentinel distinguishing "no pre-fetched group supplied" from "pre-fetched
+# and the group does not exist" (None).
+_GROUP_NOT_FETCHED: Any = object()
+
 
 class UserSimple(BaseModel, ExpiryModel):
     username: str
@@ -143,6 +147,22 @@ class OktaGroupTemplate(BaseTemplate, ExpiryModel):
     )
 
     async def apply(self, config: OktaConfig) -> TemplateChangeDetails:
+        if self.iambic_managed == IambicManaged.IMPORT_ONLY:
+            log.info(
+                "Resource is marked as import only.",
+                resource_type=self.resource_type,
+                resource_name=self.properties.name,
+            )
+            # construct skips validation (including the template_path
+            # str-coercion validator, hence the explicit str())
+            return TemplateChangeDetails.construct(
+                resource_id=self.properties.group_id,
+                resource_type=self.template_type,
+                template_path=str(self.file_path),
+                proposed_changes=[],
+                exceptions_seen=[],
+            )
+
         tasks = []
         template_changes = TemplateChangeDetails(
             resource_id=self.properties.group_id,
@@ -154,30 +174,57 @@ class OktaGroupTemplate(BaseTemplate, ExpiryModel):
             resource_name=self.properties.name,
         )
 
-        if self.iambic_managed == IambicManaged.IMPORT_ONLY:
-            log_str = "Resource is marked as import only."
-            log.info(log_str, **log_params)
-            template_changes.proposed_changes = []
-            return template_changes
-
-        for okta_organization in config.organizations:
-            if self.idp_name != okta_organization.idp_name:
-                continue
+        semaphore = config.get_apply_semaphore()
+
+        async def _prefetch_group(
+            okta_organization: OktaOrganization,
+        ) -> Optional[Group]:
+            async with semaphore:
+                return await get_group_batched(
+                    self.properties.group_id, self.properties.name, okta_organization
+                )
+
+        async def _guarded_apply(
+            okta_organization: OktaOrganization,
+            current_group: Optional[Group],
+        ) -> AccountChangeDetails:
+            # Bound the fan-out so large org counts don't trip Okta rate limits
+            async with semaphore:
+                return await self._apply_to_account(
+                    okta_organization, current_group=current_group
+                )
+
+        matching_organizations = [
+            okta_organization
+            for okta_organization in config.organizations
+            if self.idp_name == okta_organization.idp_name
+        ]
+        # Resolve the read phase for every org in one round trip before
+        # dispatching the writes so the lookups don't serialize per account.
+        current_groups = await gather_structured(
+            *[
+                _prefetch_group(okta_organization)
+                for okta_organization in matching_organizations
+            ]
+        )
+        for okta_organization, current_group in zip(
+            matching_organizations, current_groups
+        ):
             if ctx.execute:
                 log_str = "Applying changes to resource."
             else:
                 log_str = "Detecting changes for resource."
             log.info(log_str, idp_name=okta_organization.idp_name, **log_params)
-            tasks.append(self._apply_to_account(okta_organization))
+            tasks.append(_guarded_apply(okta_organization, current_group))
 
-        account_changes = await asyncio.gather(*tasks)
-        template_changes.proposed_changes = [
-            account_change
-            for account_change in account_changes
-            if any(account_change.proposed_changes)
-        ]
+        # Reduce each org's result as it completes instead of blocking on the
+        # slowest org before any post-processing starts.
+        for account_change_task in asyncio.as_completed(tasks):
+            account_change = await account_change_task
+            if account_change.proposed_changes:
+                template_changes.proposed_changes.append(account_change)
 
-        proposed_changes = [x for x in account_changes if x.proposed_changes]
+        proposed_changes = template_changes.proposed_changes
 
         if proposed_changes and ctx.execute:
             log.info(
@@ -219,26 +266,32 @@ class OktaGroupTemplate(BaseTemplate, ExpiryModel):
         }
 
     async def _apply_to_account(
-        self, okta_organization: OktaOrganization
+        self,
+        okta_organization: OktaOrganization,
+        current_group: Optional[Group] = _GROUP_NOT_FETCHED,
     ) -> AccountChangeDetails:
+        # Bind once; every pydantic attribute access goes through __getattr__
+        props = self.properties
         proposed_group = self.apply_resource_dict(okta_organization)
-        change_details = AccountChangeDetails(
+        # These inputs were validated when the template was loaded so skip
+        # re-running pydantic validation on every account application.
+        change_details = AccountChangeDetails.construct(
             account=self.idp_name,
-            resource_id=self.properties.group_id,
-            resource_type=self.properties.resource_type,
+            resource_id=props.group_id,
             new_value=proposed_group,  # TODO fix
             proposed_changes=[],
         )
 
         log_params = dict(
-            resource_type=self.properties.resource_type,
-            resource_id=self.properties.name,
+            resource_type=props.resource_type,
+            resource_id=props.name,
             organization=str(self.idp_name),
         )
 
-        current_group: Optional[Group] = await get_group(
-            self.properties.group_id, self.properties.name, okta_organization
-        )
+        if current_group is _GROUP_NOT_FETCHED:
+            current_group = await get_group_batched(
+                props.group_id, props.name, okta_organization
+            )
         if current_group:
             change_details.current_value = current_group
 
@@ -255,10 +308,10 @@ class OktaGroupTemplate(BaseTemplate, ExpiryModel):
         if not group_exists and not self.deleted:
             change_details.extend_changes(
                 [
-                    ProposedChange(
+                    ProposedChange.construct(
                         change_type=ProposedChangeType.CREATE,
-                        resource_id=self.properties.group_id,
-                        resource_type=self.properties.resource_type,
+                        resource_id=props.group_id,
+                        resource_type=props.resource_type,
                     )
                 ]
             )
@@ -272,65 +325,79 @@ class OktaGroupTemplate(BaseTemplate, ExpiryModel):
             log.info(log_str, **log_params)
 
             current_group: Group = await create_group(
-                group_name=self.properties.name,
+                group_name=props.name,
                 idp_name=self.idp_name,
-                description=self.properties.description,
+                description=props.description,
                 okta_organization=okta_organization,
             )
             if current_group:
                 change_details.current_value = current_group
 
         # TODO: Support group expansion
-        tasks.extend(
-            [
-                update_group_name(
-                    current_group,
-                    self.properties.name,
-                    okta_organization,
-                    log_params,
-                ),
-                update_group_description(
-                    current_group,
-                    self.properties.description,
-                    okta_organization,
-                    log_params,
-                ),
-                update_group_members(
-                    current_group,
-                    [
-                        member
-                        for member in self.properties.members
-                        if not member.deleted
-                    ],
-                    okta_organization,
-                    log_params,
-                ),
-                maybe_delete_group(
-                    self.deleted,
-                    current_group,
-                    okta_organization,
-                    log_params,
-                ),
-                # TODO
-                # upgrade_group_application_assignments
-            ]
-        )
+        if current_group:
+            # Only schedule updates whose inputs differ from what Okta already
+            # has; in the drift-free case no API calls are made at all.
+            if current_group.name != props.name:
+                tasks.append(
+                    update_group_name(
+                        current_group,
+                        props.name,
+                        okta_organization,
+                        log_params,
+                    )
+                )
+            if current_group.description != props.description:
+                tasks.append(
+                    update_group_description(
+                        current_group,
+                        props.description,
+                        okta_organization,
+                        log_params,
+                    )
+                )
+            desired_members = [member for member in props.members if not member.deleted]
+            if {member.username for member in desired_members} != {
+                member.username for member in current_group.members
+            }:
+                tasks.append(
+                    update_group_members(
+                        current_group,
+                        desired_members,
+                        okta_organization,
+                        log_params,
+                    )
+                )
+            if self.deleted:
+                tasks.append(
+                    maybe_delete_group(
+                        self.deleted,
+                        current_group,
+                        okta_organization,
+                        log_params,
+                    )
+                )
+            # TODO
+            # upgrade_group_application_assignments
 
-        changes_made = await asyncio.gather(*tasks)
-        if any(changes_made):
-            change_details.extend_changes(list(chain.from_iterable(changes_made)))
+        changes_made = await gather_structured(*tasks)
+        for changes in changes_made:
+            if changes:
+                change_details.extend_changes(changes)
 
+        # Only build the debug kwargs when DEBUG records will actually be kept
+        debug_enabled = is_debug_enabled()
         if ctx.execute:
-            log.debug(
-                "Successfully finished execution for resource",
-                changes_made=bool(change_details.proposed_changes),
-                **log_params,
-            )
+            if debug_enabled:
+                log.debug(
+                    "Successfully finished execution for resource",
+                    changes_made=bool(change_details.proposed_changes),
+                    **log_params,
+                )
             # TODO: Check if deleted, remove git commit the change to ratify it
             if self.deleted:
                 self.delete()
             self.write()
-        else:
+        elif debug_enabled:
             log.debug(
                 "Successfully finished scanning for drift for resource",
                 requires_changes=bool(change_details.proposed_changes),
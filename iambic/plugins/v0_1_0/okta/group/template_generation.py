@@ -3,7 +3,6 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
-from iambic.core import noq_json as json
 from iambic.core.logger import log
 from iambic.core.models import ExecutionMessage
 from iambic.core.template_generation import (
@@ -59,7 +58,7 @@ async def collect_org_groups(exe_message: ExecutionMessage, config: OktaConfig):
                 group_id=group.group_id,
                 name=group.name,
                 description=group.description,
-                members=[json.loads(m.json()) for m in group.members],
+                members=[m.dict() for m in group.members],
             ),
         )
         okta_group.file_path = os.path.join(base_path, f"{group.name}.yaml")
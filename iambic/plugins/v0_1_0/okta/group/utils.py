@@ -136,15 +136,18 @@ async def list_group_users(group: Group, okta_organization: OktaOrganization) ->
     return group
 
 
-async def list_all_groups(okta_organization: OktaOrganization) -> List[Group]:
+async def list_groups_without_members(
+    okta_organization: OktaOrganization,
+) -> List[Group]:
     """
-    List all groups in Okta.
+    List all groups in Okta without hydrating their membership.
 
     Args:
     - okta_organization: An instance of the OktaOrganization class, which provides access to the Okta API.
 
     Returns:
-    - A list of `Group` instances, representing the groups in Okta.
+    - A list of `Group` instances with an unpopulated `members` attribute. Use
+    `list_group_users` to hydrate membership for the groups that need it.
     """
 
     client = await okta_organization.get_okta_client()
@@ -173,9 +176,8 @@ async def list_all_groups(okta_organization: OktaOrganization) -> List[Group]:
             okta_organization=okta_organization.idp_name,
         )
         return []
-    tasks = []
-    for group_raw in groups:
-        group = Group(
+    return [
+        Group(
             idp_name=okta_organization.idp_name,
             name=group_raw.profile.name,
             description=group_raw.profile.description,
@@ -185,6 +187,24 @@ async def list_all_groups(okta_organization: OktaOrganization) -> List[Group]:
                 created=group_raw.created,
             ),
         )
+        for group_raw in groups
+    ]
+
+
+async def list_all_groups(okta_organization: OktaOrganization) -> List[Group]:
+    """
+    List all groups in Okta.
+
+    Args:
+    - okta_organization: An instance of the OktaOrganization class, which provides access to the Okta API.
+
+    Returns:
+    - A list of `Group` instances, representing the groups in Okta.
+    """
+
+    groups = await list_groups_without_members(okta_organization)
+    tasks = []
+    for group in groups:
         tasks.append(list_group_users(group, okta_organization))
     return list(await asyncio.gather(*tasks))
 
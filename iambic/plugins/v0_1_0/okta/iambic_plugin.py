@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Optional
 
 from okta.client import Client as OktaClient
@@ -56,6 +57,29 @@ class OktaConfig(ConfigMixin, BaseModel):
     organizations: list[OktaOrganization] = Field(
         description="A list of Okta organizations."
     )
+    concurrency: int = Field(
+        25,
+        description="The maximum number of concurrent requests to make against Okta organizations.",
+    )
+    apply_semaphores: Any = Field(
+        None, exclude=True
+    )  # dict[asyncio.AbstractEventLoop, asyncio.Semaphore], created lazily
+
+    def get_apply_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent Okta requests.
+
+        Semaphores are bound to an event loop so they are created lazily and
+        keyed by the running loop; iambic starts a fresh loop per run.
+        """
+        loop = asyncio.get_running_loop()
+        if self.apply_semaphores is None:
+            self.apply_semaphores = {}
+        semaphore = self.apply_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.apply_semaphores[loop] = asyncio.Semaphore(
+                self.concurrency
+            )
+        return semaphore
 
     @validator(
         "organizations", allow_reuse=True
@@ -4,7 +4,38 @@ import asyncio
 
 import pytest
 
-from iambic.core.aio_utils import gather_limit
+from iambic.core.aio_utils import gather_limit, gather_structured
+
+
+@pytest.mark.asyncio
+async def test_gather_structured_preserves_input_order():
+    async def echo(i: int) -> int:
+        # Finish in reverse submission order to prove results aren't
+        # completion ordered
+        await asyncio.sleep(0.01 * (3 - i))
+        return i
+
+    assert await gather_structured(*[echo(i) for i in range(3)]) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_gather_structured_cancels_siblings_on_failure():
+    sibling_cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    with pytest.raises(Exception):
+        await gather_structured(slow(), failing())
+    assert sibling_cancelled.is_set()
 
 
 @pytest.mark.asyncio
@@ -9,9 +9,14 @@ import traceback
 
 import pytest
 
+import iambic.core.parser
 import iambic.plugins.v0_1_0.example
 from iambic.config.dynamic_config import load_config
-from iambic.core.parser import load_template, load_templates
+from iambic.core.parser import (
+    invalidate_cached_template,
+    load_template,
+    load_templates,
+)
 
 MISSING_REQUIRED_FIELDS_TEMPLATE_YAML = """template_type: NOQ::Example::LocalDatabase
 template_schema_url: template_url
@@ -131,6 +136,81 @@ def test_load_template(example_test_filesystem):
     assert template
 
 
+def test_load_templates_serves_unchanged_file_from_cache(
+    example_test_filesystem, monkeypatch
+):
+    config_path, repo_dir = example_test_filesystem
+    config = asyncio.run(load_config(config_path))
+    template_path = f"{repo_dir}/{TEST_TEMPLATE_PATH}"
+
+    templates = load_templates(
+        [template_path], config.template_map, use_multiprocessing=False
+    )
+    assert templates[0].properties.name == "before"
+
+    parse_calls = []
+    original_transform_comments = iambic.core.parser.transform_comments
+
+    def counting_transform_comments(ruamel_dict):
+        parse_calls.append(ruamel_dict)
+        return original_transform_comments(ruamel_dict)
+
+    monkeypatch.setattr(
+        iambic.core.parser, "transform_comments", counting_transform_comments
+    )
+
+    # mutating the returned template must not poison the cached parse result
+    templates[0].properties.name = "mutated"
+
+    reloaded_templates = load_templates(
+        [template_path], config.template_map, use_multiprocessing=False
+    )
+    # the unchanged file is served from cache without re-parsing
+    assert parse_calls == []
+    assert reloaded_templates[0].properties.name == "before"
+
+
+def test_load_templates_rewritten_file_invalidates_cache(
+    example_test_filesystem, monkeypatch
+):
+    config_path, repo_dir = example_test_filesystem
+    config = asyncio.run(load_config(config_path))
+    template_path = f"{repo_dir}/{TEST_TEMPLATE_PATH}"
+
+    templates = load_templates(
+        [template_path], config.template_map, use_multiprocessing=False
+    )
+    assert templates[0].properties.name == "before"
+
+    # rewriting the file on disk must bypass the stale cache entry
+    with open(template_path, "w") as f:
+        f.write(TEST_TEMPLATE_YAML.format(name="after"))
+    templates = load_templates(
+        [template_path], config.template_map, use_multiprocessing=False
+    )
+    assert templates[0].properties.name == "after"
+
+    parse_calls = []
+    original_transform_comments = iambic.core.parser.transform_comments
+
+    def counting_transform_comments(ruamel_dict):
+        parse_calls.append(ruamel_dict)
+        return original_transform_comments(ruamel_dict)
+
+    monkeypatch.setattr(
+        iambic.core.parser, "transform_comments", counting_transform_comments
+    )
+
+    # explicit invalidation (what BaseTemplate.write calls after writing)
+    # forces a re-parse even though the file fingerprint is unchanged
+    invalidate_cached_template(template_path)
+    templates = load_templates(
+        [template_path], config.template_map, use_multiprocessing=False
+    )
+    assert len(parse_calls) == 1
+    assert templates[0].properties.name == "after"
+
+
 def test_missing_required_fields_templates(example_test_filesystem):
     config_path, repo_dir = example_test_filesystem
     with open(f"{repo_dir}/{TEST_TEMPLATE_PATH}", "r") as f:
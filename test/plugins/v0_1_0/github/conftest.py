@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _patched_github_runner(mocker, tmp_path_factory, target: str) -> MagicMock:
+    """Patch one github-plugin runner plus the filesystem knobs the handlers
+    touch. All runner fixtures share this one construction path; mocker
+    registers each patch with a plain list append and undoes everything in
+    one pass at teardown instead of unwinding nested patch context managers.
+    The tests only poke .called / .side_effect / .call_args, so a plain
+    MagicMock avoids autospec's signature introspection of the target."""
+    mocker.patch(
+        "iambic.plugins.v0_1_0.github.github.SHARED_CONTAINER_GITHUB_DIRECTORY",
+        "/tmp",
+    )
+    mocker.patch(
+        "iambic.lambda.app.REPO_BASE_PATH",
+        str(tmp_path_factory.mktemp("github_repo")),
+    )
+    return mocker.patch(f"iambic.plugins.v0_1_0.github.github.{target}")
+
+
+@pytest.fixture(autouse=True)
+def _silence_logs():
+    """The crashed-handler tests log full tracebacks that nobody reads;
+    disable logging below CRITICAL so the records are never formatted."""
+    previous_disable_level = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(previous_disable_level)
+
+
+@pytest.fixture(scope="module")
+def _patched_github(module_mocker):
+    # autospec introspects the whole Github class, so only pay for it once.
+    # Module rather than session scope because test_github_app.py installs its
+    # own autospec patch on the same symbol, which cannot spec a live mock.
+    return module_mocker.patch("github.Github", autospec=True)
+
+
+@pytest.fixture
+def mock_github_client(_patched_github):
+    yield _patched_github
+    _patched_github.reset_mock(return_value=True, side_effect=True)
+
+
+# Shared mock subtrees, so tests don't re-walk the attribute chains
+
+
+@pytest.fixture
+def mock_template_repo(mock_github_client):
+    return mock_github_client.get_repo.return_value
+
+
+@pytest.fixture
+def mock_pull_request(mock_template_repo):
+    return mock_template_repo.get_pull.return_value
+
+
+@pytest.fixture(scope="session")
+def es256_keypair() -> tuple[bytes, bytes]:
+    """(private_pem, public_pem) for ES256 signing.
+
+    EC key generation is the most expensive single setup step in these tests
+    and any valid keypair works, so generate one per session.
+    """
+    # import here so collecting or running unrelated tests doesn't pay for
+    # loading the cryptography C extensions
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    # This is equivalent to the ES256 algorithm
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+@pytest.fixture
+def mock_lambda_run_handler(mocker, tmp_path_factory):
+    return _patched_github_runner(mocker, tmp_path_factory, "lambda_run_handler")
+
+
+@pytest.fixture
+def mock_run_git_plan(mocker, tmp_path_factory):
+    return _patched_github_runner(mocker, tmp_path_factory, "run_git_plan")
+
+
+@pytest.fixture
+def mock_run_git_apply(mocker, tmp_path_factory):
+    return _patched_github_runner(mocker, tmp_path_factory, "run_git_apply")
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
+import copy
 import json
-import shutil
-import tempfile
-from unittest import mock
-from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, call
 
 import github
 import pytest
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import ec
 
 from iambic.core.utils import jws_encode_with_past_time
 from iambic.plugins.v0_1_0.github.github import (
@@ -24,18 +20,17 @@ from iambic.plugins.v0_1_0.github.github import (
     handle_issue_comment,
     handle_pull_request,
     maybe_merge,
+    prepare_local_repo,
 )
 from iambic.plugins.v0_1_0.github.iambic_plugin import GithubBotApprover
 
-
-@pytest.fixture
-def mock_github_client():
-    with patch("github.Github", autospec=True) as mock_github:
-        yield mock_github
+# These tests share the module-scoped github.Github autospec patch, so under
+# pytest-xdist (-n auto --dist loadgroup) they must land on one worker; other
+# modules are still distributed freely.
+pytestmark = pytest.mark.xdist_group("github_plugin")
 
 
-@pytest.fixture
-def issue_comment_git_apply_context():
+def _issue_comment_context(comment_body: str) -> dict:
     return {
         "server_url": "https://github.com",
         "run_id": "12345",
@@ -47,7 +42,7 @@ def issue_comment_git_apply_context():
         "event_name": "issue_comment",
         "event": {
             "comment": {
-                "body": "iambic git-apply",
+                "body": comment_body,
                 "user": {
                     "login": "fake-commenter",
                 },
@@ -65,155 +60,136 @@ def issue_comment_git_apply_context():
     }
 
 
-@pytest.fixture
-def issue_comment_git_plan_context():
-    return {
-        "server_url": "https://github.com",
-        "run_id": "12345",
-        "run_attempt": "1",
-        "token": "fake-token",
-        "sha": "fake-sha",
-        "ref": "fake-branch",
-        "repository": "example.com/iambic-templates",
-        "event_name": "issue_comment",
-        "event": {
-            "comment": {
-                "body": "iambic git-plan",
-                "user": {
-                    "login": "fake-commenter",
-                },
-            },
-            "issue": {
-                "number": 1,
-            },
-            "repository": {
-                "clone_url": "https://github.com/example-org/iambic-templates.git",
-            },
+# allocate the >64KB payload once per import instead of per test run
+_OVERSIZE_BODY = "h" * (BODY_MAX_LENGTH + 1)
+
+_GIT_APPLY_CONTEXT = _issue_comment_context("iambic git-apply")
+_GIT_PLAN_CONTEXT = _issue_comment_context("iambic git-plan")
+_GIT_APPROVE_CONTEXT = _issue_comment_context("iambic approve")
+_PULL_REQUEST_CONTEXT = {
+    "server_url": "https://github.com",
+    "run_id": "12345",
+    "run_attempt": "1",
+    "token": "fake-token",
+    "sha": "fake-sha",
+    "repository": "example.com/iambic-templates",
+    "event_name": "pull_request",
+    "event": {
+        "pull_request": {
+            "number": 1,
         },
-    }
+        "repository": {
+            "clone_url": "https://github.com/example-org/iambic-templates.git",
+        },
+    },
+    "iambic": {
+        "GH_OVERRIDE_TOKEN": "fake_override_token",
+    },
+}
+
+
+# The deepcopy fixtures are for tests that mutate the context; tests that only
+# read it should use the readonly_* variants, which share the template dicts.
+
+
+@pytest.fixture
+def issue_comment_git_apply_context():
+    return copy.deepcopy(_GIT_APPLY_CONTEXT)
 
 
 @pytest.fixture
 def issue_comment_git_approve_context():
-    return {
-        "server_url": "https://github.com",
-        "run_id": "12345",
-        "run_attempt": "1",
-        "token": "fake-token",
-        "sha": "fake-sha",
-        "ref": "fake-branch",
-        "repository": "example.com/iambic-templates",
-        "event_name": "issue_comment",
-        "event": {
-            "comment": {
-                "body": "iambic approve",
-                "user": {
-                    "login": "fake-commenter",
-                },
-            },
-            "issue": {
-                "number": 1,
-            },
-            "repository": {
-                "clone_url": "https://github.com/example-org/iambic-templates.git",
-            },
-        },
-    }
+    return copy.deepcopy(_GIT_APPROVE_CONTEXT)
 
 
 @pytest.fixture
-def mock_lambda_run_handler():
-    with patch(
-        "iambic.plugins.v0_1_0.github.github.lambda_run_handler", autospec=True
-    ) as _mock_lambda_run_handler:
-        with patch(
-            "iambic.plugins.v0_1_0.github.github.SHARED_CONTAINER_GITHUB_DIRECTORY",
-            "/tmp",
-        ) as _:
-            with tempfile.TemporaryDirectory() as tmpdirname:
-                with patch("iambic.lambda.app.REPO_BASE_PATH", tmpdirname):
-                    yield _mock_lambda_run_handler
+def readonly_issue_comment_git_apply_context():
+    return _GIT_APPLY_CONTEXT
 
 
 @pytest.fixture
-def mock_resolve_config_template_path():
+def readonly_issue_comment_git_plan_context():
+    return _GIT_PLAN_CONTEXT
+
+
+@pytest.fixture
+def readonly_issue_comment_git_approve_context():
+    return _GIT_APPROVE_CONTEXT
+
+
+@pytest.fixture
+def readonly_pull_request_context():
+    return _PULL_REQUEST_CONTEXT
+
+
+@pytest.fixture
+def mock_resolve_config_template_path(mocker):
     async_mock = AsyncMock()
-    with patch(
+    return mocker.patch(
         "iambic.plugins.v0_1_0.github.github.resolve_config_template_path",
         side_effect=async_mock,
-    ) as _mock_resolve_config_template_path:
-        yield _mock_resolve_config_template_path
+    )
 
 
 @pytest.fixture
-def mock_load_config():
+def mock_load_config(mocker):
     async_mock = AsyncMock()
-    with patch(
+    async_mock.return_value.github.allowed_bot_approvers = [
+        GithubBotApprover(login="fake-commenter", es256_pub_key="")
+    ]
+    return mocker.patch(
         "iambic.plugins.v0_1_0.github.github.load_config", side_effect=async_mock
-    ) as _load_config:
-        async_mock.return_value.github.allowed_bot_approvers = [
-            GithubBotApprover(login="fake-commenter", es256_pub_key="")
-        ]
-        yield _load_config
-
-
-@pytest.fixture
-def mock_run_git_plan():
-    with patch(
-        "iambic.plugins.v0_1_0.github.github.run_git_plan", autospec=True
-    ) as _mock_run_git_plan:
-        with patch(
-            "iambic.plugins.v0_1_0.github.github.SHARED_CONTAINER_GITHUB_DIRECTORY",
-            "/tmp",
-        ) as _:
-            with tempfile.TemporaryDirectory() as tmpdirname:
-                with patch("iambic.lambda.app.REPO_BASE_PATH", tmpdirname):
-                    yield _mock_run_git_plan
+    )
 
 
 @pytest.fixture
-def mock_run_git_apply():
-    with patch(
-        "iambic.plugins.v0_1_0.github.github.run_git_apply", autospec=True
-    ) as _mock_run_git_plan:
-        with patch(
-            "iambic.plugins.v0_1_0.github.github.SHARED_CONTAINER_GITHUB_DIRECTORY",
-            "/tmp",
-        ) as _:
-            with tempfile.TemporaryDirectory() as tmpdirname:
-                with patch("iambic.lambda.app.REPO_BASE_PATH", tmpdirname):
-                    yield _mock_run_git_plan
+def mock_lint_git_changes(mocker):
+    # lint_git_changes is awaited via asyncio.run, so it needs an AsyncMock
+    return mocker.patch(
+        "iambic.plugins.v0_1_0.github.github.lint_git_changes",
+        new_callable=AsyncMock,
+    )
 
 
 @pytest.fixture
-def mock_lint_git_changes():
-    with patch(
-        "iambic.plugins.v0_1_0.github.github.lint_git_changes", autospec=True
-    ) as _mock_lint_git_changes:
-        yield _mock_lint_git_changes
+def mock_commits(mocker):
+    return mocker.patch(
+        "iambic.plugins.v0_1_0.github.github.prepare_local_repo_for_new_commits",
+        new_callable=MagicMock,
+    )
 
 
 @pytest.fixture
-def mock_commits():
-    with patch(
-        "iambic.plugins.v0_1_0.github.github.prepare_local_repo_for_new_commits",
-        autospec=True,
-    ) as _mock_commits:
-        yield _mock_commits
+def mock_repository(mocker):
+    return mocker.patch("iambic.core.git.Repo", new_callable=MagicMock)
 
 
 @pytest.fixture
-def mock_repository():
-    with patch("iambic.core.git.Repo", autospec=True) as _mock_repository:
-        yield _mock_repository
+def clean_pull_request(mock_pull_request, mock_repository, request):
+    """(pull_request, context) with a clean mergeable state and a local
+    checkout whose head sha matches the event context.
+
+    Parametrize indirectly with the name of the context fixture to use, e.g.
+    @pytest.mark.parametrize(
+        "clean_pull_request", ["readonly_issue_comment_git_apply_context"],
+        indirect=True,
+    )
+    """
+    context = request.getfixturevalue(request.param)
+    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
+    mock_pull_request.head.sha = context["sha"]
+    mock_repository.clone_from.return_value.head.commit.hexsha = context["sha"]
+    return mock_pull_request, context
 
 
 def test_issue_comment_with_non_clean_mergeable_state(
-    mock_github_client, issue_comment_git_apply_context, mock_lambda_run_handler
+    mock_github_client,
+    mock_pull_request,
+    readonly_issue_comment_git_apply_context,
+    mock_lambda_run_handler,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
     mock_pull_request.mergeable_state = MERGEABLE_STATE_BLOCKED
-    handle_issue_comment(mock_github_client, issue_comment_git_apply_context)
+    handle_issue_comment(mock_github_client, readonly_issue_comment_git_apply_context)
     assert mock_lambda_run_handler.called is False
     assert mock_pull_request.merge.called is False
 
@@ -228,70 +204,83 @@ def test_issue_comment_with_not_applicable_comment_body(
     assert return_code == HandleIssueCommentReturnCode.NO_MATCHING_BODY
 
 
+@pytest.mark.parametrize(
+    "clean_pull_request",
+    ["readonly_issue_comment_git_apply_context"],
+    indirect=True,
+)
 def test_issue_comment_with_clean_mergeable_state(
     mock_github_client,
-    issue_comment_git_apply_context,
+    clean_pull_request,
     mock_run_git_apply,
-    mock_repository,
 ):
+    mock_pull_request, context = clean_pull_request
     mock_run_git_apply.return_value = []
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.head.sha = issue_comment_git_apply_context["sha"]
-    mock_repository.clone_from.return_value.head.commit.hexsha = (
-        issue_comment_git_apply_context["sha"]
-    )
-    handle_issue_comment(mock_github_client, issue_comment_git_apply_context)
+    handle_issue_comment(mock_github_client, context)
     assert mock_run_git_apply.called
     assert mock_pull_request.merge.called
 
 
-# invariant: PR is only merged if and only if git-apply is successful
+# invariant: PR is only merged if and only if git-apply/git-plan is successful
+@pytest.mark.parametrize(
+    "clean_pull_request,runner_name,extra_mock_names",
+    [
+        ("readonly_issue_comment_git_apply_context", "mock_run_git_apply", []),
+        (
+            "readonly_issue_comment_git_plan_context",
+            "mock_run_git_plan",
+            ["mock_resolve_config_template_path", "mock_lint_git_changes"],
+        ),
+    ],
+    indirect=["clean_pull_request"],
+    ids=["git-apply", "git-plan"],
+)
 def test_issue_comment_with_clean_mergeable_state_and_lambda_handler_crashed(
+    request,
     mock_github_client,
-    issue_comment_git_apply_context,
-    mock_run_git_apply,
-    mock_repository,
+    clean_pull_request,
+    runner_name,
+    extra_mock_names,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.head.sha = issue_comment_git_apply_context["sha"]
-    mock_repository.clone_from.return_value.head.commit.hexsha = (
-        issue_comment_git_apply_context["sha"]
-    )
-    mock_run_git_apply.side_effect = Exception("unexpected failure")
+    mock_pull_request, context = clean_pull_request
+    runner = request.getfixturevalue(runner_name)
+    extra_mocks = [request.getfixturevalue(name) for name in extra_mock_names]
+    runner.side_effect = Exception("unexpected failure")
     with pytest.raises(Exception):
-        handle_issue_comment(mock_github_client, issue_comment_git_apply_context)
-    assert mock_run_git_apply.called
+        handle_issue_comment(mock_github_client, context)
+    for extra_mock in extra_mocks:
+        assert extra_mock.called
+    assert runner.called
     assert mock_pull_request.create_issue_comment.called
     assert "Traceback" in mock_pull_request.create_issue_comment.call_args[0][0]
     assert not mock_pull_request.merge.called
 
 
-# invariant: PR is only merged if and only if git-apply is successful
-def test_plan_issue_comment_with_clean_mergeable_state_and_lambda_handler_crashed(
-    mock_github_client,
-    issue_comment_git_plan_context,
-    mock_resolve_config_template_path,
-    mock_lint_git_changes,
-    mock_run_git_plan,
-    mock_repository,
-):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.head.sha = issue_comment_git_plan_context["sha"]
-    mock_repository.clone_from.return_value.head.commit.hexsha = (
-        issue_comment_git_plan_context["sha"]
+def test_prepare_local_repo(tmp_path, mocker):
+    repo_dir = str(tmp_path)
+    mock_clone_git_repo = mocker.patch(
+        "iambic.plugins.v0_1_0.github.github.clone_git_repo", autospec=True
     )
-    mock_run_git_plan.side_effect = Exception("unexpected failure")
-    with pytest.raises(Exception):
-        handle_issue_comment(mock_github_client, issue_comment_git_plan_context)
-    assert mock_resolve_config_template_path.called
-    assert mock_lint_git_changes.called
-    assert mock_run_git_plan.called
-    assert mock_pull_request.create_issue_comment.called
-    assert "Traceback" in mock_pull_request.create_issue_comment.call_args[0][0]
-    assert not mock_pull_request.merge.called
+    mocker.patch(
+        "iambic.plugins.v0_1_0.github.github.get_remote_default_branch",
+        autospec=True,
+        return_value="main",
+    )
+    mock_remote = MagicMock()
+    mock_clone_git_repo.return_value.remotes = [mock_remote]
+    repo = prepare_local_repo(
+        "https://github.com/example-org/iambic-templates.git",
+        repo_dir,
+        "fake-branch",
+    )
+
+    mock_clone_git_repo.assert_called_once_with(
+        "https://github.com/example-org/iambic-templates.git", repo_dir, None
+    )
+    assert repo is mock_clone_git_repo.return_value
+    mock_remote.fetch.assert_called_once()
+    repo.git.checkout.assert_called_once_with("-b", "attempt/git-apply", "main")
+    repo.git.merge.assert_called_once_with("origin/fake-branch")
 
 
 def test_format_github_url():
@@ -302,39 +291,18 @@ def test_format_github_url():
     assert url == expected_url
 
 
-@pytest.fixture
-def pull_request_context():
-    return {
-        "server_url": "https://github.com",
-        "run_id": "12345",
-        "run_attempt": "1",
-        "token": "fake-token",
-        "sha": "fake-sha",
-        "repository": "example.com/iambic-templates",
-        "event_name": "pull_request",
-        "event": {
-            "pull_request": {
-                "number": 1,
-            },
-            "repository": {
-                "clone_url": "https://github.com/example-org/iambic-templates.git",
-            },
-        },
-        "iambic": {
-            "GH_OVERRIDE_TOKEN": "fake_override_token",
-        },
-    }
-
-
 def test_pull_request_plan(
-    mock_github_client, pull_request_context, mock_run_git_plan, mock_repository
+    mock_github_client,
+    mock_pull_request,
+    readonly_pull_request_context,
+    mock_run_git_plan,
+    mock_repository,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.head.sha = pull_request_context["sha"]
-    mock_repository.clone_from.return_value.head.commit.hexsha = pull_request_context[
-        "sha"
-    ]
-    handle_pull_request(mock_github_client, pull_request_context)
+    mock_pull_request.head.sha = readonly_pull_request_context["sha"]
+    mock_repository.clone_from.return_value.head.commit.hexsha = (
+        readonly_pull_request_context["sha"]
+    )
+    handle_pull_request(mock_github_client, readonly_pull_request_context)
     assert (
         mock_run_git_plan.called is False
     )  # because this flow only directly calls create_issue_comment on the pull request
@@ -343,79 +311,63 @@ def test_pull_request_plan(
     )  # because this flow only issue the comment
 
 
+_SESSION_CASES = (
+    (
+        "noqdev/iambic-templates-itest",
+        "1",
+        "org=noqdev,repo=iambic-templates-itest,pr=1",
+    ),
+    ("noqdev/a^b", "1", "org=noqdev,repo=ab,pr=1"),
+)
+
+
 @pytest.mark.parametrize(
     "repo_name,pr_number,expected_result",
-    [
-        (
-            "noqdev/iambic-templates-itest",
-            "1",
-            "org=noqdev,repo=iambic-templates-itest,pr=1",
-        ),
-        ("noqdev/a^b", "1", "org=noqdev,repo=ab,pr=1"),
-    ],
+    _SESSION_CASES,
+    ids=["clean", "sanitized"],
 )
 def test_get_session_name(repo_name, pr_number, expected_result):
     session_name = get_session_name(repo_name, pr_number)
     assert session_name == expected_result
 
 
+@pytest.mark.parametrize(
+    "clean_pull_request",
+    ["readonly_issue_comment_git_plan_context"],
+    indirect=True,
+)
 def test_issue_comment_with_git_plan(
     mock_github_client,
-    issue_comment_git_plan_context,
+    clean_pull_request,
     mock_resolve_config_template_path,
     mock_lint_git_changes,
     mock_run_git_plan,
-    mock_repository,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.head.sha = issue_comment_git_plan_context["sha"]
-    mock_repository.clone_from.return_value.head.commit.hexsha = (
-        issue_comment_git_plan_context["sha"]
-    )
-    handle_issue_comment(mock_github_client, issue_comment_git_plan_context)
+    mock_pull_request, context = clean_pull_request
+    handle_issue_comment(mock_github_client, context)
     assert mock_resolve_config_template_path.called
     assert mock_lint_git_changes.called
     assert mock_run_git_plan.called
     assert not mock_pull_request.merge.called
 
 
+# EC key generation dominates this test's wall-clock, so give it its own
+# group rather than serializing it behind the mock-only tests.
+@pytest.mark.xdist_group("crypto")
 def test_issue_comment_with_allowed_approver(
     mock_github_client,
+    mock_pull_request,
     issue_comment_git_approve_context,
-    mock_repository,
     mock_resolve_config_template_path,
     mock_load_config,
     mock_commits,
+    es256_keypair,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    assert mock_repository
-    assert mock_resolve_config_template_path
-    assert mock_load_config
-    assert mock_commits
-
     approver: GithubBotApprover = (
         mock_load_config.side_effect.return_value.github.allowed_bot_approvers[0]
     )
 
-    # Generate a new ECDSA private key
-    private_key = ec.generate_private_key(
-        ec.SECP256R1()
-    )  # This is equivalent to the ES256 algorithm
-    public_key = private_key.public_key()
-
-    # Convert keys to PEM format
-    private_pem = private_key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption(),
-    )
-    assert private_pem
-    public_pem = public_key.public_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo,
-    )
-    assert public_pem
+    private_pem, public_pem = es256_keypair
 
     approver.es256_pub_key = public_pem.decode("utf-8")
     payload = {
@@ -451,46 +403,43 @@ def test_issue_comment_with_allowed_approver(
 
 def test_issue_comment_with_not_allowed_approver(
     mock_github_client,
-    issue_comment_git_approve_context,
-    mock_repository,
+    mock_pull_request,
+    readonly_issue_comment_git_approve_context,
     mock_resolve_config_template_path,
     mock_load_config,
     mock_commits,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    assert mock_commits
-    assert mock_repository
-    assert mock_resolve_config_template_path
-    assert mock_load_config
     mock_load_config.side_effect.return_value.github.allowed_bot_approvers = []
-    handle_issue_comment(mock_github_client, issue_comment_git_approve_context)
+    handle_issue_comment(mock_github_client, readonly_issue_comment_git_approve_context)
     assert mock_pull_request.create_review.called is False
 
 
 # verify if there are changes during git_apply. those changes are push
 # back into the PR
+@pytest.mark.parametrize(
+    "clean_pull_request",
+    ["readonly_issue_comment_git_apply_context"],
+    indirect=True,
+)
 def test_issue_comment_with_clean_mergeable_state_with_additional_commits(
     mock_github_client,
-    issue_comment_git_apply_context,
+    clean_pull_request,
     mock_run_git_apply,
     mock_repository,
 ):
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
-    mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.head.sha = issue_comment_git_apply_context["sha"]
-    mock_pull_request.head.ref = issue_comment_git_apply_context["ref"]
+    mock_pull_request, context = clean_pull_request
+    mock_pull_request.head.ref = context["ref"]
     pre_sha = "pre_sha"
     post_sha = "post_sha"
 
-    # we are mocking how the sha has changed in the local checkout repo
-    type(mock_repository.clone_from.return_value.head.commit).hexsha = PropertyMock(
-        side_effect=[
-            pre_sha,
-            post_sha,
-        ]
+    # we are mocking how the sha has changed in the local checkout repo;
+    # a plain property over an iterator skips PropertyMock's call machinery
+    shas = iter([pre_sha, post_sha])
+    type(mock_repository.clone_from.return_value.head.commit).hexsha = property(
+        lambda self: next(shas)
     )
 
-    handle_issue_comment(mock_github_client, issue_comment_git_apply_context)
+    handle_issue_comment(mock_github_client, context)
     assert mock_run_git_apply.called
 
     # verify we did push back the changes to remote
@@ -504,141 +453,139 @@ def test_issue_comment_with_clean_mergeable_state_with_additional_commits(
     mock_pull_request.merge.assert_called_with(sha=post_sha, merge_method="merge")
 
 
-def test_run_handler():
+_RUN_HANDLER_PULL_REQUEST_ARG = {
+    "token": "fake-token",
+    "event_name": "pull_request",
+    "iambic": {"GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN"},
+    "repository": "exampleorg/iambic-templates",
+    "event": {"pull_request": {"number": 4}},
+}
+
+_RUN_HANDLER_ISSUE_COMMENT_ARG = {
+    "token": "fake-token",
+    "event_name": "issue_comment",
+    "iambic": {"GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN"},
+    "repository": "exampleorg/iambic-templates",
+    "event": {
+        "comment": {
+            "body": "iambic git-apply",
+            "user": {
+                "login": "fake-commenter",
+            },
+        },
+        "issue": {"number": 4},
+        "repository": {
+            "clone_url": "https://github.com/exampleorg/iambic-templates.git"
+        },
+    },
+}
+
+_RUN_HANDLER_IAMBIC_COMMAND_ARG = {
+    "token": "fake-token",
+    "event_name": "iambic_command",
+    "iambic": {
+        "GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN",
+        "IAMBIC_CLOUD_IMPORT_CMD": "import",
+    },
+    "repository": "exampleorg/iambic-templates",
+    "event": {
+        "comment": {
+            "body": "iambic git-apply",
+        },
+        "issue": {"number": 4},
+        "repository": {
+            "clone_url": "https://github.com/exampleorg/iambic-templates.git"
+        },
+    },
+}
+
+
+def _verify_run_handler_pull_request(mock_Github):
+    assert 2 == mock_Github.call_count
+    mock_Github.assert_has_calls(
+        calls=[
+            call("fake-token"),
+            call("GH_OVERRIDE_TOKEN"),
+        ]
+    )
+    mock_Github.return_value.get_repo.assert_called_once_with(
+        "exampleorg/iambic-templates"
+    )
+    mock_Github.return_value.get_repo.return_value.get_pull.assert_called_once_with(4)
+    mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.assert_called_once_with(
+        "iambic git-plan"
+    )
+
+
+def _verify_run_handler_issue_comment(mock_Github):
+    assert 1 == mock_Github.call_count
+    mock_Github.assert_called_once_with("fake-token")
+    mock_Github.return_value.get_repo.assert_called_once_with(
+        "exampleorg/iambic-templates"
+    )
+    mock_Github.return_value.get_repo.return_value.get_pull.assert_called_once_with(4)
+    mock_Github.return_value.get_repo.return_value.get_pull.return_value.mergeable_state.__ne__.assert_called_once_with(
+        "clean"
+    )
+    mock_Github.return_value.get_repo.return_value.get_pull.return_value.mergeable_state.__str__.assert_called_once_with()
+    mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.assert_called_once()
+    assert (
+        "This probably means that the necessary approvals have not been granted for the request."
+        in mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.call_args.args[
+            0
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "arg,verify",
+    [
+        (_RUN_HANDLER_PULL_REQUEST_ARG, _verify_run_handler_pull_request),
+        (_RUN_HANDLER_ISSUE_COMMENT_ARG, _verify_run_handler_issue_comment),
+        # TODO: Need to mock the paths
+        (_RUN_HANDLER_IAMBIC_COMMAND_ARG, None),  # expected to raise
+    ],
+    ids=["pull_request", "issue_comment", "iambic_command"],
+)
+def test_run_handler(arg, verify, mocker):
     from iambic.plugins.v0_1_0.github.github import run_handler
 
     mock_Github = MagicMock(name="Github")
-    with mock.patch(
-        "iambic.plugins.v0_1_0.github.github.github.Github", new=mock_Github
-    ):
-        # mg.generate_uut_mocks_with_asserts(run_handler)
-        arg = {
-            "token": "fake-token",
-            "event_name": "pull_request",
-            "iambic": {"GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN"},
-            "repository": "exampleorg/iambic-templates",
-            "event": {"pull_request": {"number": 4}},
-        }
-        run_handler(arg)
-        assert 2 == mock_Github.call_count
-        mock_Github.assert_has_calls(
-            calls=[
-                call("fake-token"),
-                call("GH_OVERRIDE_TOKEN"),
-            ]
-        )
-        mock_Github.return_value.get_repo.assert_called_once_with(
-            "exampleorg/iambic-templates"
-        )
-        mock_Github.return_value.get_repo.return_value.get_pull.assert_called_once_with(
-            4
-        )
-        mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.assert_called_once_with(
-            "iambic git-plan"
-        )
-        mock_Github.reset_mock()
-
-        arg = {
-            "token": "fake-token",
-            "event_name": "issue_comment",
-            "iambic": {"GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN"},
-            "repository": "exampleorg/iambic-templates",
-            "event": {
-                "comment": {
-                    "body": "iambic git-apply",
-                    "user": {
-                        "login": "fake-commenter",
-                    },
-                },
-                "issue": {"number": 4},
-                "repository": {
-                    "clone_url": "https://github.com/exampleorg/iambic-templates.git"
-                },
-            },
-        }
-        run_handler(arg)
-        assert 1 == mock_Github.call_count
-        mock_Github.assert_called_once_with("fake-token")
-        mock_Github.return_value.get_repo.assert_called_once_with(
-            "exampleorg/iambic-templates"
-        )
-        mock_Github.return_value.get_repo.return_value.get_pull.assert_called_once_with(
-            4
-        )
-        mock_Github.return_value.get_repo.return_value.get_pull.return_value.mergeable_state.__ne__.assert_called_once_with(
-            "clean"
-        )
-        mock_Github.return_value.get_repo.return_value.get_pull.return_value.mergeable_state.__str__.assert_called_once_with()
-        mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.assert_called_once()
-        assert (
-            "This probably means that the necessary approvals have not been granted for the request."
-            in mock_Github.return_value.get_repo.return_value.get_pull.return_value.create_issue_comment.call_args.args[
-                0
-            ]
-        )
-        mock_Github.reset_mock()
-
-        arg = {
-            "token": "fake-token",
-            "event_name": "iambic_command",
-            "iambic": {
-                "GH_OVERRIDE_TOKEN": "GH_OVERRIDE_TOKEN",
-                "IAMBIC_CLOUD_IMPORT_CMD": "import",
-            },
-            "repository": "exampleorg/iambic-templates",
-            "event": {
-                "comment": {
-                    "body": "iambic git-apply",
-                },
-                "issue": {"number": 4},
-                "repository": {
-                    "clone_url": "https://github.com/exampleorg/iambic-templates.git"
-                },
-            },
-        }
-        # TODO: Need to mock the paths
+    mocker.patch("iambic.plugins.v0_1_0.github.github.github.Github", new=mock_Github)
+    # mg.generate_uut_mocks_with_asserts(run_handler)
+    if verify is None:
         with pytest.raises(Exception):
             run_handler(arg)
+    else:
+        run_handler(arg)
+        verify(mock_Github)
 
 
-@pytest.fixture
-def mock_proposed_changes_filesystem():
-    temp_templates_directory = tempfile.mkdtemp(
-        prefix="iambic_test_temp_templates_directory"
+@pytest.fixture(scope="session")
+def mock_proposed_changes_filesystem(tmp_path_factory):
+    # the file content is constant and only ever read, so write it once
+    temp_templates_directory = tmp_path_factory.mktemp(
+        "iambic_test_temp_templates_directory"
     )
-
-    try:
-        contents = """hello world"""
-        contents_path = f"{temp_templates_directory}/proposed_changes.yaml"
-
-        with open(contents_path, "w") as f:
-            f.write(contents)
-
-        yield contents_path, contents
-    finally:
-        try:
-            shutil.rmtree(temp_templates_directory)
-        except Exception as e:
-            print(e)
+    contents = "hello world"
+    contents_path = temp_templates_directory / "proposed_changes.yaml"
+    contents_path.write_text(contents)
+    return str(contents_path), contents
 
 
 # verify if there are changes during git_apply. those changes are push
 # back into the PR
 def test_post_artifact_to_companion_repository(
     mock_github_client,
+    mock_template_repo,
     mock_proposed_changes_filesystem,
 ):
     contents_path, contents = mock_proposed_changes_filesystem
     markdown_summary = "test_summary"
 
-    mock_template_repo = mock_github_client.get_repo.return_value
-
     # we are mocking how the sha has changed in the local checkout repo
-    type(mock_template_repo).full_name = PropertyMock(
-        side_effect=[
-            "ExampleOrg/iambic-templates",
-        ]
-    )
+    full_names = iter(["ExampleOrg/iambic-templates"])
+    type(mock_template_repo).full_name = property(lambda self: next(full_names))
 
     pull_number = "1337"
     op_name = "plan"
@@ -689,18 +636,23 @@ def test_post_artifact_to_companion_repository(
 
 def test_ensure_body_length_fits_github_spec():
     blob_html_url = "https://fake-location/"
-    body = "h" * (BODY_MAX_LENGTH + 1)
+    body = _OVERSIZE_BODY
     new_body = ensure_body_length_fits_github_spec(body, blob_html_url=blob_html_url)
     assert blob_html_url in new_body
 
 
 def test_maybe_merge_crashes(
     mock_github_client,
+    mock_pull_request,
+    monkeypatch,
 ):
     def merge_error(*args, **kwargs):
         raise github.GithubException(409, "409 unable to merge", {})
 
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
+    # make the retry backoff instant instead of sleeping for real
+    monkeypatch.setattr(
+        "iambic.plugins.v0_1_0.github.github.time.sleep", lambda *_: None
+    )
     mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
     mock_pull_request.merge.side_effect = merge_error
     templates_repo = mock_github_client.get_repo("ExampleOrg/iambic-templates")
@@ -721,13 +673,16 @@ def test_maybe_merge_crashes(
 
 def test_maybe_merge_does_not_crash(
     mock_github_client,
+    mock_pull_request,
+    monkeypatch,
 ):
-    def merge_error(*args, **kwargs):
-        return MagicMock()
-
-    mock_pull_request = mock_github_client.get_repo.return_value.get_pull.return_value
+    # make the retry backoff instant instead of sleeping for real
+    monkeypatch.setattr(
+        "iambic.plugins.v0_1_0.github.github.time.sleep", lambda *_: None
+    )
     mock_pull_request.mergeable_state = MERGEABLE_STATE_CLEAN
-    mock_pull_request.merge.side_effect = merge_error
+    # any non-exception result will do; a constant skips side_effect dispatch
+    mock_pull_request.merge.return_value = object()
     templates_repo = mock_github_client.get_repo("ExampleOrg/iambic-templates")
     pull_number = 1337
     merge_sha = "non_existent_sha"
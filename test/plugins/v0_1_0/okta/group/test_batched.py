@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from test.plugins.v0_1_0.okta.test_utils import (  # noqa: F401 # intentional for mocks
+    mock_okta_organization,
+)
+
+import pytest
+
+import iambic.plugins.v0_1_0.okta.group.batched
+from iambic.plugins.v0_1_0.okta.group.batched import get_group_batched
+from iambic.plugins.v0_1_0.okta.group.utils import create_group
+
+
+@pytest.mark.asyncio
+async def test_get_group_batched_single_read_uses_targeted_lookup(
+    mock_okta_organization, monkeypatch  # noqa: F811 # intentional for mocks
+):
+    group = await create_group(
+        "example_group", "example.org", "example description", mock_okta_organization
+    )
+
+    list_calls = []
+    original_list_groups_without_members = (
+        iambic.plugins.v0_1_0.okta.group.batched.list_groups_without_members
+    )
+
+    async def counting_list_groups_without_members(okta_organization):
+        list_calls.append(okta_organization)
+        return await original_list_groups_without_members(okta_organization)
+
+    monkeypatch.setattr(
+        iambic.plugins.v0_1_0.okta.group.batched,
+        "list_groups_without_members",
+        counting_list_groups_without_members,
+    )
+
+    fetched_group = await get_group_batched(
+        group.group_id, group.name, mock_okta_organization
+    )
+    assert fetched_group.name == "example_group"
+    # a lone read must not pay for a full group listing
+    assert list_calls == []
+
+
+@pytest.mark.asyncio
+async def test_get_group_batched_coalesces_concurrent_reads(
+    mock_okta_organization, monkeypatch  # noqa: F811 # intentional for mocks
+):
+    group_1 = await create_group(
+        "example_group_1", "example.org", "example description", mock_okta_organization
+    )
+    group_2 = await create_group(
+        "example_group_2", "example.org", "example description", mock_okta_organization
+    )
+    # Not requested below; its membership must never be fetched
+    await create_group(
+        "bystander_group", "example.org", "example description", mock_okta_organization
+    )
+
+    list_calls = []
+    original_list_groups_without_members = (
+        iambic.plugins.v0_1_0.okta.group.batched.list_groups_without_members
+    )
+
+    async def counting_list_groups_without_members(okta_organization):
+        list_calls.append(okta_organization)
+        return await original_list_groups_without_members(okta_organization)
+
+    monkeypatch.setattr(
+        iambic.plugins.v0_1_0.okta.group.batched,
+        "list_groups_without_members",
+        counting_list_groups_without_members,
+    )
+
+    hydrated_group_names = []
+    original_list_group_users = (
+        iambic.plugins.v0_1_0.okta.group.batched.list_group_users
+    )
+
+    async def counting_list_group_users(group, okta_organization):
+        hydrated_group_names.append(group.name)
+        return await original_list_group_users(group, okta_organization)
+
+    monkeypatch.setattr(
+        iambic.plugins.v0_1_0.okta.group.batched,
+        "list_group_users",
+        counting_list_group_users,
+    )
+
+    fetched_groups = await asyncio.gather(
+        get_group_batched(group_1.group_id, group_1.name, mock_okta_organization),
+        get_group_batched(group_2.group_id, group_2.name, mock_okta_organization),
+    )
+    assert {g.name for g in fetched_groups} == {"example_group_1", "example_group_2"}
+    # both reads are served from one shared listing call
+    assert len(list_calls) == 1
+    # membership is hydrated only for the requested groups, not the whole org
+    assert sorted(hydrated_group_names) == ["example_group_1", "example_group_2"]
+
+
+@pytest.mark.asyncio
+async def test_get_group_batched_read_arriving_mid_drain_is_not_stranded(
+    mock_okta_organization, monkeypatch  # noqa: F811 # intentional for mocks
+):
+    group = await create_group(
+        "example_group", "example.org", "example description", mock_okta_organization
+    )
+
+    original_get_group = iambic.plugins.v0_1_0.okta.group.batched.get_group
+
+    async def slow_get_group(group_id, group_name, okta_organization):
+        # Hold the first drain's Okta call open long past the batch window
+        await asyncio.sleep(0.2)
+        return await original_get_group(group_id, group_name, okta_organization)
+
+    monkeypatch.setattr(
+        iambic.plugins.v0_1_0.okta.group.batched, "get_group", slow_get_group
+    )
+
+    first = asyncio.create_task(
+        get_group_batched(group.group_id, group.name, mock_okta_organization)
+    )
+    # Land the second read while the first drain's lookup is still in flight;
+    # it missed that drain's snapshot so a fresh drain must pick it up.
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(
+        get_group_batched(group.group_id, group.name, mock_okta_organization)
+    )
+    fetched_groups = await asyncio.wait_for(asyncio.gather(first, second), timeout=5)
+    assert [g.name for g in fetched_groups] == ["example_group", "example_group"]
+
+
+def test_get_group_batched_survives_event_loop_teardown(
+    mock_okta_organization,  # noqa: F811 # intentional for mocks
+):
+    async def first_run():
+        group = await create_group(
+            "example_group",
+            "example.org",
+            "example description",
+            mock_okta_organization,
+        )
+        read = asyncio.ensure_future(
+            get_group_batched(group.group_id, group.name, mock_okta_organization)
+        )
+        # Let apply schedule the drain, then return mid-window so the loop is
+        # torn down with the drain task still pending
+        await asyncio.sleep(0)
+        read.cancel()
+        return group
+
+    # run_until_complete + close (unlike asyncio.run) does not cancel leftover
+    # tasks, leaving the fetcher holding a never-finished drain task bound to
+    # a dead loop
+    first_loop = asyncio.new_event_loop()
+    try:
+        group = first_loop.run_until_complete(first_run())
+    finally:
+        first_loop.close()
+
+    async def second_run():
+        return await asyncio.wait_for(
+            get_group_batched(group.group_id, group.name, mock_okta_organization),
+            timeout=5,
+        )
+
+    # A fresh loop must not block on the previous loop's stranded drain
+    fetched_group = asyncio.run(second_run())
+    assert fetched_group.name == "example_group"